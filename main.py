@@ -1,6 +1,7 @@
 import sys
 import random
 import os
+import functools
 try:
     import pygame  # type: ignore
 except ModuleNotFoundError:
@@ -11,6 +12,15 @@ except ModuleNotFoundError:
         f'Install it with:\n  "{py}" -m pip install pygame\n'
         'Then select this interpreter in your IDE.'
     )
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:
+    py = sys.executable
+    raise SystemExit(
+        f'numpy is not installed for this Python interpreter:\n  {py}\n'
+        f'Install it with:\n  "{py}" -m pip install numpy\n'
+        'Then select this interpreter in your IDE.'
+    )
 
 # Tetris using pygame
 # Controls:
@@ -38,6 +48,8 @@ WIN_HEIGHT = PLAY_HEIGHT + MARGIN * 2
 
 PLAY_TOPLEFT = (MARGIN, MARGIN)
 PANEL_TOPLEFT = (PLAY_TOPLEFT[0] + PLAY_WIDTH + MARGIN, PLAY_TOPLEFT[1])
+PLAY_RECT = (PLAY_TOPLEFT[0], PLAY_TOPLEFT[1], PLAY_WIDTH, PLAY_HEIGHT)
+PANEL_RECT = (PANEL_TOPLEFT[0], PANEL_TOPLEFT[1], SIDE, PLAY_HEIGHT)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -57,27 +69,87 @@ COLORS = {
     'GHOST': (150, 150, 150)
 }
 
-# Shape definitions using base block coordinates and rotating about pivot (1,1)
+# Board cells hold a piece id (0 = empty); COLOR_TABLE maps ids back to colors
+KINDS = ('I', 'O', 'T', 'S', 'Z', 'J', 'L')
+KIND_IDS = {k: i + 1 for i, k in enumerate(KINDS)}
+COLOR_TABLE = [None] + [COLORS[k] for k in KINDS]
+
+# Shape definitions using base block coordinates in SRS spawn orientation
 # Coords are within a 4x4 box
 BASE_SHAPES = {
     'I': [(0, 1), (1, 1), (2, 1), (3, 1)],
     'O': [(1, 1), (2, 1), (1, 2), (2, 2)],
     'T': [(1, 0), (0, 1), (1, 1), (2, 1)],
-    'S': [(1, 1), (2, 1), (0, 2), (1, 2)],
-    'Z': [(0, 1), (1, 1), (1, 2), (2, 2)],
+    'S': [(1, 0), (2, 0), (0, 1), (1, 1)],
+    'Z': [(0, 0), (1, 0), (1, 1), (2, 1)],
     'J': [(0, 0), (0, 1), (1, 1), (2, 1)],
     'L': [(2, 0), (0, 1), (1, 1), (2, 1)],
 }
 
+# SRS rotation centres: I and O turn about the middle of their 4x4 box,
+# the 3-wide pieces about the block at (1, 1)
+PIVOTS = {'I': (1.5, 1.5), 'O': (1.5, 1.5)}
+
 CLOCKWISE = 1
 COUNTER = -1
 
+# Event and key constants, bound once so the event loop skips the module lookups
+QUIT = pygame.QUIT
+KEYDOWN = pygame.KEYDOWN
+KEYUP = pygame.KEYUP
+K_ESCAPE = pygame.K_ESCAPE
+K_RETURN = pygame.K_RETURN
+K_LEFT = pygame.K_LEFT
+K_RIGHT = pygame.K_RIGHT
+K_UP = pygame.K_UP
+K_DOWN = pygame.K_DOWN
+K_SPACE = pygame.K_SPACE
+K_c = pygame.K_c
+K_p = pygame.K_p
+K_x = pygame.K_x
+K_z = pygame.K_z
+
+LINE_CLEAR_TIME = 0.35  # seconds the cleared rows flash before collapsing
+
+# Held Left/Right: Delayed Auto Shift before repeating, then one shift per Auto Repeat Rate tick
+DAS_DELAY = 0.17
+ARR_INTERVAL = 0.03
+
+# SRS wall kicks, (from_state, to_state) -> offsets tried in order.
+# Offsets use SRS convention (+y is up), so they are applied as (x + dx, y - dy).
+KICKS_JLSTZ = {
+    ('0', 'R'): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],
+    ('R', '0'): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],
+    ('R', '2'): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],
+    ('2', 'R'): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],
+    ('2', 'L'): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],
+    ('L', '2'): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],
+    ('L', '0'): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],
+    ('0', 'L'): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],
+}
+KICKS_I = {
+    ('0', 'R'): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],
+    ('R', '0'): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],
+    ('R', '2'): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],
+    ('2', 'R'): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],
+    ('2', 'L'): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],
+    ('L', '2'): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],
+    ('L', '0'): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],
+    ('0', 'L'): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],
+}
+KICKS_O = {key: [(0, 0)] for key in KICKS_JLSTZ}
+KICK_TABLES = {'I': KICKS_I, 'O': KICKS_O}
+
+# SRS state name for each Piece.rotation. rotate_point turns the shape
+# counter-clockwise on screen (y grows downward), so rotation 1 is SRS state L.
+ROT_STATES = ('0', 'L', '2', 'R')
+
 # Helper to load the window icon
 def _load_window_icon():
     try:
         path = os.path.join(os.path.dirname(__file__), "icon.png")
         if os.path.exists(path):
-            img = pygame.image.load(path).convert_alpha()
+            img = pygame.image.load(path)
             # Use small icon size on Windows title bars
             size = (16, 16) if sys.platform.startswith("win") else (32, 32)
             img = pygame.transform.smoothscale(img, size)
@@ -139,6 +211,8 @@ if sys.platform.startswith("win"):
                 pass
     except Exception:
         pass
+# Held-key movement is timed by DAS/ARR in the game loop, not by OS key repeat
+pygame.key.set_repeat(0)
 CLOCK = pygame.time.Clock()
 FONT = pygame.font.SysFont("consolas", 22)
 FONT_BIG = pygame.font.SysFont("consolas", 36, bold=True)
@@ -146,6 +220,12 @@ FONT_HUGE = pygame.font.SysFont("consolas", 48, bold=True)
 FONT_SMALL = pygame.font.SysFont("consolas", 18)
 
 
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    # Text rasterisation is costly and HUD strings rarely change; reuse the surfaces
+    return font.render(text, True, color).convert_alpha()
+
+
 def rotate_point(x, y, pivot=(1, 1), dir=CLOCKWISE):
     px, py = pivot
     if dir == CLOCKWISE:
@@ -167,6 +247,57 @@ def rotate_coords(coords, times=1, pivot=(1, 1)):
     return out
 
 
+# All rotations are fixed, so build the lookup tables once: SHAPES[kind][rotation]
+SHAPES = {k: [tuple(rotate_coords(BASE_SHAPES[k], r, PIVOTS.get(k, (1, 1)))) for r in range(4)]
+          for k in BASE_SHAPES}
+
+
+def _shape_bits(coords):
+    # (x offset of the leftmost block, [(row offset, row mask with that block at bit 0), ...])
+    xoff = min(cx for cx, _ in coords)
+    rows = {}
+    for cx, cy in coords:
+        rows[cy] = rows.get(cy, 0) | (1 << (cx - xoff))
+    return xoff, sorted(rows.items())
+
+
+# Occupancy bitmasks per shape: bit x of a row mask is column x
+PIECE_BITS = {k: [_shape_bits(v) for v in SHAPES[k]] for k in SHAPES}
+FULL_ROW = (1 << COLS) - 1
+
+
+def _offset_expr(var, offset):
+    if not offset:
+        return var
+    return f"({var} {'+' if offset > 0 else '-'} {abs(offset)})"
+
+
+def _checker_source(kind, rotation):
+    # Straight-line collision test for one shape: bounds, then one AND per touched row
+    xoff, rows = PIECE_BITS[kind][rotation]
+    sx = _offset_expr("x", xoff)
+    width = max(mask.bit_length() for _, mask in rows)
+    terms = [f"0 <= {sx}", f"{sx} + {width} <= {COLS}", f"{_offset_expr('y', rows[-1][0])} < {ROWS}"]
+    for roff, mask in rows:
+        ry = _offset_expr("y", roff)
+        terms.append(f"({ry} < 0 or not rows_bits[{ry}] & ({mask} << {sx}))")
+    body = "\n        and ".join(terms)
+    return f"def _check_{kind}_{rotation}(x, y, rows_bits):\n    return ({body})\n"
+
+
+def _build_checkers():
+    checkers = {}
+    for kind in SHAPES:
+        for rotation in range(4):
+            namespace = {}
+            exec(_checker_source(kind, rotation), namespace)
+            checkers[(kind, rotation)] = namespace[f"_check_{kind}_{rotation}"]
+    return checkers
+
+
+# CHECKERS[(kind, rotation)](x, y, rows_bits) -> True if the piece fits there
+CHECKERS = _build_checkers()
+
 class Piece:
     def __init__(self, kind):
         self.kind = kind  # 'I','O','T','S','Z','J','L'
@@ -176,8 +307,7 @@ class Piece:
         self.rotation = 0  # 0..3
 
     def get_blocks(self):
-        coords = rotate_coords(BASE_SHAPES[self.kind], self.rotation)
-        return [(self.x + cx, self.y + cy) for (cx, cy) in coords]
+        return [(self.x + cx, self.y + cy) for (cx, cy) in SHAPES[self.kind][self.rotation]]
 
     def clone(self):
         p = Piece(self.kind)
@@ -188,187 +318,230 @@ class Piece:
         return p
 
 
-def create_grid(locked):
-    grid = [[None for _ in range(COLS)] for _ in range(ROWS)]
-    for (x, y), color in locked.items():
-        if 0 <= y < ROWS and 0 <= x < COLS:
-            grid[y][x] = color
-    return grid
+def new_board():
+    return np.zeros((ROWS, COLS), dtype=np.uint8)
+
+
+def new_col_top():
+    # Row index of the highest filled cell per column; ROWS means the column is empty
+    return np.full(COLS, ROWS, dtype=np.int16)
 
 
-def in_bounds(x, y):
-    return 0 <= x < COLS and y < ROWS  # y can be negative (spawn)
+def refresh_col_top(board, col_top):
+    filled = board != 0
+    col_top[:] = np.where(filled.any(axis=0), filled.argmax(axis=0), ROWS)
 
 
-def valid_position(blocks, locked):
-    for (x, y) in blocks:
-        if not in_bounds(x, y):
-            return False
-        if y >= 0 and (x, y) in locked:
-            return False
-    return True
+def new_rows_bits():
+    # Occupancy bitboard: bit x of rows_bits[y] is set iff cell (x, y) is filled
+    return [0] * ROWS
 
 
-def try_move(piece, dx, dy, locked):
-    p = piece.clone()
-    p.x += dx
-    p.y += dy
-    if valid_position(p.get_blocks(), locked):
-        piece.x, piece.y = p.x, p.y
+def valid_position(kind, rotation, x, y, rows_bits):
+    return CHECKERS[(kind, rotation)](x, y, rows_bits)
+
+
+def lock_piece(piece, board, col_top, rows_bits):
+    # Writes the piece into all three board representations; returns True if any
+    # block is still above the top row (game over)
+    pid = KIND_IDS[piece.kind]
+    topped_out = False
+    for (x, y) in piece.get_blocks():
+        if y < 0:
+            topped_out = True
+            continue
+        board[y, x] = pid
+        col_top[x] = min(col_top[x], y)
+        rows_bits[y] |= 1 << x
+    return topped_out
+
+
+def try_move(piece, dx, dy, rows_bits):
+    # Calls the shape's checker directly: this runs on every gravity tick and key press
+    new_x, new_y = piece.x + dx, piece.y + dy
+    if CHECKERS[(piece.kind, piece.rotation)](new_x, new_y, rows_bits):
+        piece.x, piece.y = new_x, new_y
         return True
     return False
 
 
-def try_rotate(piece, direction, locked):
+def try_rotate(piece, direction, rows_bits):
     old_rot = piece.rotation
-    piece.rotation = (piece.rotation + (1 if direction == CLOCKWISE else -1)) % 4
-    # Simple wall kicks: test offsets
-    for dx in (0, -1, 1, -2, 2):
-        p = piece.clone()
-        p.x += dx
-        if valid_position(p.get_blocks(), locked):
-            piece.x = p.x
+    new_rot = (old_rot + (1 if direction == CLOCKWISE else -1)) % 4
+    kicks = KICK_TABLES.get(piece.kind, KICKS_JLSTZ)[(ROT_STATES[old_rot], ROT_STATES[new_rot])]
+    for dx, dy in kicks:
+        new_x, new_y = piece.x + dx, piece.y - dy
+        if valid_position(piece.kind, new_rot, new_x, new_y, rows_bits):
+            piece.x, piece.y, piece.rotation = new_x, new_y, new_rot
             return True
-    piece.rotation = old_rot
     return False
 
 
-def get_ghost_piece(piece, locked):
+def get_ghost_piece(piece, board, col_top):
+    # Lowest block of the piece in each column it covers
+    lowest = {}
+    for (x, y) in piece.get_blocks():
+        if x not in lowest or y > lowest[x]:
+            lowest[x] = y
+    drop = ROWS
+    for x, y in lowest.items():
+        top = col_top[x]
+        if top <= y:
+            # Tucked under an overhang: find the first filled cell below the piece instead
+            below = np.flatnonzero(board[y + 1:, x])
+            top = y + 1 + below[0] if below.size else ROWS
+        drop = min(drop, top - 1 - y)
     ghost = piece.clone()
-    while True:
-        ghost.y += 1
-        if not valid_position(ghost.get_blocks(), locked):
-            ghost.y -= 1
-            break
+    ghost.y += int(drop)
     return ghost
 
 
-def clear_rows(locked):
-    full_rows = []
-    for y in range(ROWS):
-        full = True
-        for x in range(COLS):
-            if (x, y) not in locked:
-                full = False
-                break
-        if full:
-            full_rows.append(y)
+def _shift_rows(board, rows):
+    # Compact the surviving rows to the bottom in one copy, empty rows on top
+    if not len(rows):
+        return
+    mask = np.ones(ROWS, dtype=bool)
+    mask[rows] = False
+    survivors = board[mask]
+    board[:len(rows)] = 0
+    board[len(rows):] = survivors
 
+
+def clear_rows(board, col_top, rows_bits):
+    full_rows = get_full_rows(rows_bits)
     if not full_rows:
         return 0
+    _shift_rows(board, full_rows)
+    # One partitioning pass instead of a del/insert list shift per cleared row
+    rows_bits[:] = [0] * len(full_rows) + [bits for bits in rows_bits if bits != FULL_ROW]
+    refresh_col_top(board, col_top)
+    return len(full_rows)
 
-    # Remove full rows
-    for y in full_rows:
-        for x in range(COLS):
-            locked.pop((x, y), None)
-
-    # Move above rows down
-    # Process from bottom up for stability
-    for y in sorted(full_rows):
-        above = [(x, yy) for (x, yy) in sorted(list(locked.keys()), key=lambda p: p[1]) if yy < y]
-        for (x, yy) in reversed(above):
-            color = locked.pop((x, yy))
-            locked[(x, yy + 1)] = color
 
-    return len(full_rows)
+_BLOCK_CACHE = {}
 
 
-def draw_block(surface, x, y, color, outline=True, alpha=None):
-    px = PLAY_TOPLEFT[0] + x * BLOCK
-    py = PLAY_TOPLEFT[1] + y * BLOCK
-    rect = pygame.Rect(px, py, BLOCK, BLOCK)
+def get_block_surface(color, alpha=None):
+    # Shaded blocks are pixel-identical per (color, alpha); render each once and reuse
+    key = (color, alpha)
+    surf = _BLOCK_CACHE.get(key)
+    if surf is not None:
+        return surf
 
+    rect = pygame.Rect(0, 0, BLOCK, BLOCK)
     if alpha is not None:
-        s = pygame.Surface((BLOCK, BLOCK), pygame.SRCALPHA)
+        surf = pygame.Surface((BLOCK, BLOCK), pygame.SRCALPHA)
         r, g, b = color
-        s.fill((r, g, b, alpha))
-        surface.blit(s, (px, py))
+        surf.fill((r, g, b, alpha))
     else:
         # Shaded block with bevel lines
-        pygame.draw.rect(surface, color, rect)
+        surf = pygame.Surface((BLOCK, BLOCK))
+        surf.fill(color)
         def clamp(v):
             return max(0, min(255, v))
         r, g, b = color
         light = (clamp(int(r * 1.2 + 24)), clamp(int(g * 1.2 + 24)), clamp(int(b * 1.2 + 24)))
         dark = (clamp(int(r * 0.55)), clamp(int(g * 0.55)), clamp(int(b * 0.55)))
-        pygame.draw.line(surface, light, (px, py), (px + BLOCK - 1, py), 2)
-        pygame.draw.line(surface, light, (px, py), (px, py + BLOCK - 1), 2)
-        pygame.draw.line(surface, dark, (px, py + BLOCK - 1), (px + BLOCK - 1, py + BLOCK - 1), 2)
-        pygame.draw.line(surface, dark, (px + BLOCK - 1, py), (px + BLOCK - 1, py + BLOCK - 1), 2)
+        pygame.draw.line(surf, light, (0, 0), (BLOCK - 1, 0), 2)
+        pygame.draw.line(surf, light, (0, 0), (0, BLOCK - 1), 2)
+        pygame.draw.line(surf, dark, (0, BLOCK - 1), (BLOCK - 1, BLOCK - 1), 2)
+        pygame.draw.line(surf, dark, (BLOCK - 1, 0), (BLOCK - 1, BLOCK - 1), 2)
+    pygame.draw.rect(surf, GRAY, rect, 1)
+
+    surf = surf.convert_alpha() if alpha is not None else surf.convert()
+    _BLOCK_CACHE[key] = surf
+    return surf
+
+
+def blit_batch(surface, pairs):
+    # fblits (pygame-ce) skips per-blit validation; plain pygame falls back to blits
+    if not pairs:
+        return
+    if hasattr(surface, "fblits"):
+        surface.fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
 
-    if outline:
-        pygame.draw.rect(surface, GRAY, rect, 1)
 
+def block_pairs(blocks, surf):
+    ox, oy = PLAY_TOPLEFT
+    return [(surf, (ox + x * BLOCK, oy + y * BLOCK)) for (x, y) in blocks if y >= 0]
 
-def draw_empty_cell(surface, x, y):
-    px = PLAY_TOPLEFT[0] + x * BLOCK
-    py = PLAY_TOPLEFT[1] + y * BLOCK
-    base = (22, 22, 22)
-    alt = (28, 28, 28)
-    color = base if (x + y) % 2 == 0 else alt
-    pygame.draw.rect(surface, color, (px, py, BLOCK, BLOCK))
-    pygame.draw.rect(surface, (40, 40, 40), (px, py, BLOCK, BLOCK), 1)
+
+def pairs_rect(pairs):
+    # Bounding rect of a batch of block blits
+    rects = [pygame.Rect(pos, (BLOCK, BLOCK)) for _, pos in pairs]
+    return rects[0].unionall(rects[1:])
 
 
-def draw_grid(surface, grid):
+def _build_background():
+    # Pre-render the empty checkerboard once; blitted as a single background each frame
+    bg = pygame.Surface((PLAY_WIDTH, PLAY_HEIGHT)).convert()
+    base = (22, 22, 22)
+    alt = (28, 28, 28)
     for y in range(ROWS):
         for x in range(COLS):
-            if grid[y][x]:
-                draw_block(surface, x, y, grid[y][x], outline=True)
-            else:
-                draw_empty_cell(surface, x, y)
+            px = x * BLOCK
+            py = y * BLOCK
+            color = base if (x + y) % 2 == 0 else alt
+            pygame.draw.rect(bg, color, (px, py, BLOCK, BLOCK))
+            pygame.draw.rect(bg, (40, 40, 40), (px, py, BLOCK, BLOCK), 1)
+    return bg
 
 
-def draw_current_piece(surface, piece):
-    for (x, y) in piece.get_blocks():
-        if y >= 0:
-            draw_block(surface, x, y, piece.color, outline=True)
+_BG_SURF = _build_background()
 
 
-def draw_ghost(surface, ghost):
-    for (x, y) in ghost.get_blocks():
-        if y >= 0:
-            draw_block(surface, x, y, COLORS['GHOST'], outline=True, alpha=60)
+# Block surface per board piece id (index 0, empty, is never drawn)
+_ID_SURFS = [None] + [get_block_surface(color) for color in COLOR_TABLE[1:]]
 
 
-def draw_panel(surface, score, level, lines, next_queue, hold, high_score=0):
-    # Panel background
-    panel_rect = pygame.Rect(PANEL_TOPLEFT[0], PANEL_TOPLEFT[1], SIDE, PLAY_HEIGHT)
-    pygame.draw.rect(surface, LIGHT_GRAY, panel_rect, border_radius=6)
-    pygame.draw.rect(surface, GRAY, panel_rect, 2, border_radius=6)
+def locked_pairs(board):
+    ox, oy = PLAY_TOPLEFT
+    ys, xs = np.nonzero(board)
+    ids = board[ys, xs]
+    return [(_ID_SURFS[i], (ox + x * BLOCK, oy + y * BLOCK))
+            for x, y, i in zip(xs.tolist(), ys.tolist(), ids.tolist())]
 
-    # Title
-    title = FONT_BIG.render("TETRIS", True, WHITE)
-    surface.blit(title, (PANEL_TOPLEFT[0] + 16, PANEL_TOPLEFT[1] + 12))
 
-    # Stats (tighter spacing)
-    y = PANEL_TOPLEFT[1] + 54
-    surface.blit(FONT.render(f"Score: {score}", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 22
-    surface.blit(FONT.render(f"Level: {level}", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 22
-    surface.blit(FONT.render(f"Lines: {lines}", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 22
-    surface.blit(FONT.render(f"High Score: {high_score}", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 24
-
-    # Hold
-    surface.blit(FONT.render("Hold:", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 6
-    box_h = draw_mini_piece(surface, hold.kind if hold else None, (PANEL_TOPLEFT[0] + 16, y), block=18)
-    y += box_h + 6
-
-    # Next
-    surface.blit(FONT.render("Next:", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
-    y += 6
-    # Draw next 2 (compact)
-    for i in range(min(2, len(next_queue))):
-        box_h = draw_mini_piece(surface, next_queue[i], (PANEL_TOPLEFT[0] + 16, y), block=18)
-        y += box_h + 6
+def draw_playfield(surface, board, current=None, ghost=None):
+    # One batched blit each for background + locked cells, the ghost and the current piece.
+    # Returns the bounding rects of the ghost and current piece for dirty-rect updates.
+    bg_pairs = [(_BG_SURF, PLAY_TOPLEFT)] + locked_pairs(board)
+    ghost_pairs = block_pairs(ghost.get_blocks(), get_block_surface(COLORS['GHOST'], 60)) if ghost else []
+    current_pairs = block_pairs(current.get_blocks(), get_block_surface(current.color)) if current else []
+    blit_batch(surface, bg_pairs)
+    blit_batch(surface, ghost_pairs)
+    blit_batch(surface, current_pairs)
+    return [pairs_rect(pairs) for pairs in (ghost_pairs, current_pairs) if pairs]
+
+
+MINI_BLOCK = 18
+MINI_BOX = 4 * MINI_BLOCK + 8
+
+# Panel layout (relative to the panel's top-left); fixed, so the chrome can be pre-rendered
+PANEL_STATS_Y = 54
+PANEL_HOLD_Y = PANEL_STATS_Y + 22 * 3 + 24
+PANEL_HOLD_BOX_Y = PANEL_HOLD_Y + 6
+PANEL_NEXT_Y = PANEL_HOLD_BOX_Y + MINI_BOX + 6
+PANEL_NEXT_BOX_YS = (PANEL_NEXT_Y + 6, PANEL_NEXT_Y + 6 + MINI_BOX + 6)
+PANEL_CONTROLS_Y = PANEL_NEXT_BOX_YS[-1] + MINI_BOX + 6 + 6
+
+
+def _build_panel():
+    # Background, borders and every label that never changes
+    panel = pygame.Surface((SIDE, PLAY_HEIGHT), pygame.SRCALPHA)
+    panel_rect = panel.get_rect()
+    pygame.draw.rect(panel, LIGHT_GRAY, panel_rect, border_radius=6)
+    pygame.draw.rect(panel, GRAY, panel_rect, 2, border_radius=6)
+
+    panel.blit(render_text(FONT_BIG, "TETRIS", WHITE), (16, 12))
+    panel.blit(render_text(FONT, "Hold:", WHITE), (16, PANEL_HOLD_Y))
+    panel.blit(render_text(FONT, "Next:", WHITE), (16, PANEL_NEXT_Y))
 
     # Controls mini help
-    y += 6
-    surface.blit(FONT.render("Controls:", True, WHITE), (PANEL_TOPLEFT[0] + 16, y))
+    y = PANEL_CONTROLS_Y
+    panel.blit(render_text(FONT, "Controls:", WHITE), (16, y))
     y += 4
     help_lines = [
         "Left/Right: Move",
@@ -379,7 +552,29 @@ def draw_panel(surface, score, level, lines, next_queue, hold, high_score=0):
     ]
     for hl in help_lines:
         y += 18
-        surface.blit(FONT_SMALL.render(hl, True, WHITE), (PANEL_TOPLEFT[0] + 20, y))
+        panel.blit(render_text(FONT_SMALL, hl, WHITE), (20, y))
+    return panel.convert_alpha()
+
+
+def draw_panel(surface, score, level, lines, next_queue, hold, high_score=0):
+    x0, y0 = PANEL_TOPLEFT
+    surface.blit(_PANEL_BG, PANEL_TOPLEFT)
+
+    # Stats (tighter spacing)
+    y = y0 + PANEL_STATS_Y
+    surface.blit(render_text(FONT, f"Score: {score}", WHITE), (x0 + 16, y))
+    y += 22
+    surface.blit(render_text(FONT, f"Level: {level}", WHITE), (x0 + 16, y))
+    y += 22
+    surface.blit(render_text(FONT, f"Lines: {lines}", WHITE), (x0 + 16, y))
+    y += 22
+    surface.blit(render_text(FONT, f"High Score: {high_score}", WHITE), (x0 + 16, y))
+
+    surface.blit(_MINI_PIECE[hold.kind if hold else None], (x0 + 16, y0 + PANEL_HOLD_BOX_Y))
+    # Next 2 (compact); empty boxes when there is no queue yet
+    for i, box_y in enumerate(PANEL_NEXT_BOX_YS):
+        kind = next_queue[i] if i < len(next_queue) else None
+        surface.blit(_MINI_PIECE[kind], (x0 + 16, y0 + box_y))
 
 
 def draw_mini_piece(surface, kind, topleft, block=20):
@@ -413,27 +608,48 @@ def draw_mini_piece(surface, kind, topleft, block=20):
     return box_h
 
 
+def _build_mini_piece(kind):
+    surf = pygame.Surface((MINI_BOX, MINI_BOX), pygame.SRCALPHA)
+    draw_mini_piece(surf, kind, (0, 0), block=MINI_BLOCK)
+    return surf.convert_alpha()
+
+
+_PANEL_BG = _build_panel()
+_MINI_PIECE = {kind: _build_mini_piece(kind) for kind in (None,) + KINDS}
+
+
 def draw_playfield_border(surface):
     rect = pygame.Rect(PLAY_TOPLEFT[0], PLAY_TOPLEFT[1], PLAY_WIDTH, PLAY_HEIGHT)
     pygame.draw.rect(surface, LIGHT_GRAY, rect, 2, border_radius=4)
 
 
+def _build_dim(alpha):
+    s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+    s.fill((0, 0, 0, alpha))
+    return s
+
+
+# Full-window dim overlays, allocated once instead of every overlay frame
+_DIM_140 = _build_dim(140)
+_DIM_150 = _build_dim(150)
+_DIM_180 = _build_dim(180)
+# The level popup fades, so this one is opaque black driven by surface alpha
+_DIM_80 = pygame.Surface((WIN_WIDTH, WIN_HEIGHT)).convert()
+_DIM_80.fill(BLACK)
+
+
 def draw_pause(surface):
-    s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA)
-    s.fill((0, 0, 0, 140))
-    surface.blit(s, (0, 0))
-    txt = FONT_HUGE.render("PAUSED", True, WHITE)
+    surface.blit(_DIM_140, (0, 0))
+    txt = render_text(FONT_HUGE, "PAUSED", WHITE)
     surface.blit(txt, (PLAY_TOPLEFT[0] + PLAY_WIDTH // 2 - txt.get_width() // 2,
                        PLAY_TOPLEFT[1] + PLAY_HEIGHT // 2 - txt.get_height() // 2))
 
 
 def draw_game_over(surface, score):
-    s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA)
-    s.fill((0, 0, 0, 180))
-    surface.blit(s, (0, 0))
-    txt = FONT_HUGE.render("GAME OVER", True, WHITE)
-    sub = FONT_BIG.render("Press Enter to play again, Esc to quit", True, WHITE)
-    scr = FONT_BIG.render(f"Score: {score}", True, WHITE)
+    surface.blit(_DIM_180, (0, 0))
+    txt = render_text(FONT_HUGE, "GAME OVER", WHITE)
+    sub = render_text(FONT_BIG, "Press Enter to play again, Esc to quit", WHITE)
+    scr = render_text(FONT_BIG, f"Score: {score}", WHITE)
     cx = PLAY_TOPLEFT[0] + PLAY_WIDTH // 2
     cy = PLAY_TOPLEFT[1] + PLAY_HEIGHT // 2
     surface.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2 - 40))
@@ -443,11 +659,9 @@ def draw_game_over(surface, score):
 
 def draw_start_menu(surface):
     # Dim entire window and center text across full width
-    s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA)
-    s.fill((0, 0, 0, 150))
-    surface.blit(s, (0, 0))
-    title = FONT_HUGE.render("TETRIS", True, WHITE)
-    subtitle = FONT_BIG.render("Press Enter to Start", True, WHITE)
+    surface.blit(_DIM_150, (0, 0))
+    title = render_text(FONT_HUGE, "TETRIS", WHITE)
+    subtitle = render_text(FONT_BIG, "Press Enter to Start", WHITE)
     cx = WIN_WIDTH // 2
     cy = WIN_HEIGHT // 2
     surface.blit(title, (cx - title.get_width() // 2, cy - 140))
@@ -465,37 +679,36 @@ def draw_start_menu(surface):
     ]
     y = cy - 20
     for line in controls:
-        surf = FONT.render(line, True, WHITE)
+        surf = render_text(FONT, line, WHITE)
         surface.blit(surf, (cx - surf.get_width() // 2, y))
         y += 28
 
 
+# Solid white row faded with set_alpha, reused for every flashing row and frame
+_FLASH_ROW = pygame.Surface((PLAY_WIDTH, BLOCK), pygame.SRCALPHA).convert_alpha()
+_FLASH_ROW.fill((*WHITE_FULL, 255))
+
+
 def draw_line_clear_flash(surface, rows, phase):
     alpha = int(180 * (1 - abs(phase * 2 - 1)))
     alpha = max(60, alpha)
+    _FLASH_ROW.set_alpha(alpha)
     for y in rows:
-        s = pygame.Surface((PLAY_WIDTH, BLOCK), pygame.SRCALPHA)
-        s.fill((*WHITE_FULL, alpha))
-        surface.blit(s, (PLAY_TOPLEFT[0], PLAY_TOPLEFT[1] + y * BLOCK))
+        surface.blit(_FLASH_ROW, (PLAY_TOPLEFT[0], PLAY_TOPLEFT[1] + y * BLOCK))
 
 
 def draw_level_popup(surface, level, t):
     a = max(0, min(1.0, t / 1.2))
-    s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA)
-    s.fill((0, 0, 0, int(80 * a)))
-    surface.blit(s, (0, 0))
-    txt = FONT_BIG.render(f"Level Up! Level {level}", True, WHITE)
+    _DIM_80.set_alpha(int(80 * a))
+    surface.blit(_DIM_80, (0, 0))
+    txt = render_text(FONT_BIG, f"Level Up! Level {level}", WHITE)
     x = PLAY_TOPLEFT[0] + PLAY_WIDTH // 2 - txt.get_width() // 2
     y = PLAY_TOPLEFT[1] + 20
     surface.blit(txt, (x, y))
 
 
-def get_full_rows(locked):
-    full = []
-    for y in range(ROWS):
-        if all((x, y) in locked for x in range(COLS)):
-            full.append(y)
-    return full
+def get_full_rows(rows_bits):
+    return [y for y, bits in enumerate(rows_bits) if bits == FULL_ROW]
 
 
 HS_FILE = os.path.join(os.path.dirname(__file__), "tetris_highscore.txt")
@@ -529,6 +742,10 @@ def tetris_gravity_speed(level):
     return max(0.8 - (level * 0.07), 0.05)
 
 
+# Seconds per cell by level; speed bottoms out well before the last entry
+GRAVITY_SPEED = [tetris_gravity_speed(lvl) for lvl in range(30)]
+
+
 def main():
     running = True
     paused = False
@@ -539,7 +756,9 @@ def main():
     lines_cleared_total = 0
     high_score = load_high_score()
 
-    locked = {}
+    board = new_board()
+    col_top = new_col_top()
+    rows_bits = new_rows_bits()
 
     # Piece queue - 7-bag
     bag = new_bag()
@@ -559,29 +778,39 @@ def main():
     soft_drop = False
     soft_drop_bonus_cells = 0
 
+    das_dir = 0  # -1 left, 1 right, 0 none held
+    das_time = 0.0
+
     game_over = False
-    clear_anim = None  # {'rows': [...], 't': seconds}
+    clear_anim = None  # {'rows': [...], 't': seconds left, 't_total': seconds}
     level_popup_t = 0.0
 
+    # Dirty-rect state from the last presented frame; None forces a full flip
+    prev_piece_rects = None
+    prev_board = None
+    prev_hud = None
+
     while running:
         dt = CLOCK.tick(60) / 1000.0
 
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 running = False
                 break
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+            if event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
                     running = False
                     break
                 if in_menu:
-                    if event.key == pygame.K_RETURN:
+                    if event.key == K_RETURN:
                         # start new game
                         score = 0
                         level = 0
                         lines_cleared_total = 0
-                        locked = {}
+                        board = new_board()
+                        col_top = new_col_top()
+                        rows_bits = new_rows_bits()
                         bag = new_bag()
                         next_queue = bag[:]
                         current = Piece(next_queue.pop(0))
@@ -594,18 +823,22 @@ def main():
                         on_ground = False
                         soft_drop = False
                         soft_drop_bonus_cells = 0
+                        das_dir = 0
+                        das_time = 0.0
                         game_over = False
                         clear_anim = None
                         level_popup_t = 0.0
                         in_menu = False
                     continue
                 if game_over:
-                    if event.key == pygame.K_RETURN:
+                    if event.key == K_RETURN:
                         # restart
                         score = 0
                         level = 0
                         lines_cleared_total = 0
-                        locked = {}
+                        board = new_board()
+                        col_top = new_col_top()
+                        rows_bits = new_rows_bits()
                         bag = new_bag()
                         next_queue = bag[:]
                         current = Piece(next_queue.pop(0))
@@ -618,12 +851,14 @@ def main():
                         on_ground = False
                         soft_drop = False
                         soft_drop_bonus_cells = 0
+                        das_dir = 0
+                        das_time = 0.0
                         game_over = False
                         clear_anim = None
                         level_popup_t = 0.0
                     continue
 
-                if event.key == pygame.K_p:
+                if event.key == K_p:
                     paused = not paused
 
                 if paused:
@@ -631,49 +866,48 @@ def main():
                 if clear_anim is not None:
                     continue
 
-                if event.key == pygame.K_LEFT:
-                    moved = try_move(current, -1, 0, locked)
-                    if moved and on_ground:
-                        lock_timer = 0.0
-                elif event.key == pygame.K_RIGHT:
-                    moved = try_move(current, 1, 0, locked)
+                if event.key in (K_LEFT, K_RIGHT):
+                    das_dir = -1 if event.key == K_LEFT else 1
+                    das_time = 0.0
+                    moved = try_move(current, das_dir, 0, rows_bits)
                     if moved and on_ground:
                         lock_timer = 0.0
-                elif event.key in (pygame.K_UP, pygame.K_x):
-                    rotated = try_rotate(current, CLOCKWISE, locked)
+                elif event.key in (K_UP, K_x):
+                    rotated = try_rotate(current, CLOCKWISE, rows_bits)
                     if rotated and on_ground:
                         lock_timer = 0.0
-                elif event.key == pygame.K_z:
-                    rotated = try_rotate(current, COUNTER, locked)
+                elif event.key == K_z:
+                    rotated = try_rotate(current, COUNTER, rows_bits)
                     if rotated and on_ground:
                         lock_timer = 0.0
-                elif event.key == pygame.K_DOWN:
+                elif event.key == K_DOWN:
                     soft_drop = True
-                elif event.key == pygame.K_SPACE:
+                elif event.key == K_SPACE:
                     # Hard drop
                     dist = 0
-                    while try_move(current, 0, 1, locked):
+                    while valid_position(current.kind, current.rotation, current.x, current.y + 1, rows_bits):
+                        current.y += 1
                         dist += 1
                     score += 2 * dist
                     # Lock immediately
-                    for (x, y) in current.get_blocks():
-                        locked[(x, y)] = current.color
-                    # Soft drop bonus accrued
-                    score += soft_drop_bonus_cells
-                    soft_drop_bonus_cells = 0
-                    rows = get_full_rows(locked)
-                    if rows:
-                        clear_anim = {"rows": rows, "t": 0.35}
-                        current = None
-                    else:
-                        current = Piece(next_queue.pop(0))
-                        if len(next_queue) < 7:
-                            next_queue += new_bag()
-                        can_hold = True
-                        fall_timer = 0.0
-                        lock_timer = 0.0
-                        on_ground = False
-                elif event.key == pygame.K_c:
+                    game_over = lock_piece(current, board, col_top, rows_bits)
+                    if not game_over:
+                        # Soft drop bonus accrued
+                        score += soft_drop_bonus_cells
+                        soft_drop_bonus_cells = 0
+                        rows = get_full_rows(rows_bits)
+                        if rows:
+                            clear_anim = {"rows": rows, "t": LINE_CLEAR_TIME, "t_total": LINE_CLEAR_TIME}
+                            current = None
+                        else:
+                            current = Piece(next_queue.pop(0))
+                            if len(next_queue) < 7:
+                                next_queue += new_bag()
+                            can_hold = True
+                            fall_timer = 0.0
+                            lock_timer = 0.0
+                            on_ground = False
+                elif event.key == K_c:
                     if can_hold:
                         if hold_piece is None:
                             hold_piece = current.clone()
@@ -693,9 +927,14 @@ def main():
                         lock_timer = 0.0
                         on_ground = False
 
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_DOWN:
+            if event.type == KEYUP:
+                if event.key == K_DOWN:
                     soft_drop = False
+                elif (event.key, das_dir) in ((K_LEFT, -1), (K_RIGHT, 1)):
+                    # Fall back to the opposite arrow if it is still held
+                    other = K_RIGHT if das_dir == -1 else K_LEFT
+                    das_dir = -das_dir if pygame.key.get_pressed()[other] else 0
+                    das_time = 0.0
 
         if not running:
             break
@@ -703,33 +942,39 @@ def main():
         if paused:
             # Draw paused screen
             WIN.fill(BLACK)
-            grid = create_grid(locked)
-            draw_grid(WIN, grid)
-            if current is not None:
-                draw_current_piece(WIN, current)
-                ghost = get_ghost_piece(current, locked)
-                draw_ghost(WIN, ghost)
+            ghost = get_ghost_piece(current, board, col_top) if current is not None else None
+            draw_playfield(WIN, board, current, ghost)
             draw_panel(WIN, score, level, lines_cleared_total, next_queue, hold_piece, high_score)
             draw_playfield_border(WIN)
             draw_pause(WIN)
             pygame.display.flip()
+            prev_piece_rects = None
             continue
 
         if in_menu:
             # Keep background visible, then overlay centered start menu
             WIN.fill(BLACK)
-            grid = create_grid(locked)
-            draw_grid(WIN, grid)
+            draw_playfield(WIN, board)
             draw_panel(WIN, 0, 0, 0, [], None, high_score)
             draw_playfield_border(WIN)
             draw_start_menu(WIN)
             pygame.display.flip()
+            prev_piece_rects = None
             continue
 
         if not game_over and clear_anim is None:
+            # Auto-shift while Left/Right is held: at most one move per frame
+            if das_dir:
+                das_time += dt
+                if das_time >= DAS_DELAY:
+                    # Clamp so a long frame can't bank a burst of shifts
+                    das_time = min(das_time, DAS_DELAY) - ARR_INTERVAL
+                    if try_move(current, das_dir, 0, rows_bits) and on_ground:
+                        lock_timer = 0.0
+
             # Gravity
             fall_timer += dt
-            speed = tetris_gravity_speed(level)
+            speed = GRAVITY_SPEED[min(level, len(GRAVITY_SPEED) - 1)]
             if soft_drop:
                 # Speed up gravity and award soft drop points per cell moved
                 # We simulate faster ticks by reducing threshold
@@ -738,7 +983,7 @@ def main():
             moved_down = False
             while fall_timer >= speed:
                 fall_timer -= speed
-                if try_move(current, 0, 1, locked):
+                if try_move(current, 0, 1, rows_bits):
                     moved_down = True
                     if soft_drop:
                         soft_drop_bonus_cells += 1
@@ -750,9 +995,7 @@ def main():
             if moved_down:
                 # If moved down successfully, not on ground yet necessarily
                 # Check if the next cell is blocked to start lock timer
-                p = current.clone()
-                p.y += 1
-                if not valid_position(p.get_blocks(), locked):
+                if not valid_position(current.kind, current.rotation, current.x, current.y + 1, rows_bits):
                     on_ground = True
                 else:
                     on_ground = False
@@ -762,21 +1005,16 @@ def main():
                 lock_timer += dt
                 if lock_timer >= lock_delay:
                     # Lock piece
-                    for (x, y) in current.get_blocks():
-                        if y < 0:
-                            # Game over
-                            game_over = True
-                            break
-                        locked[(x, y)] = current.color
+                    game_over = lock_piece(current, board, col_top, rows_bits)
                     if not game_over:
                         # Score soft drop bonus
                         score += soft_drop_bonus_cells
                         soft_drop_bonus_cells = 0
 
                         # Detect clears for animation
-                        rows = get_full_rows(locked)
+                        rows = get_full_rows(rows_bits)
                         if rows:
-                            clear_anim = {"rows": rows, "t": 0.35}
+                            clear_anim = {"rows": rows, "t": LINE_CLEAR_TIME, "t_total": LINE_CLEAR_TIME}
                             current = None
                         else:
                             # Spawn next
@@ -794,7 +1032,7 @@ def main():
             if clear_anim["t"] <= 0:
                 rows = clear_anim["rows"]
                 cleared = len(rows)
-                _ = clear_rows(locked)
+                _ = clear_rows(board, col_top, rows_bits)
                 if cleared:
                     lines_cleared_total += cleared
                     score += [0, 40, 100, 300, 1200][cleared] * (level + 1)
@@ -812,18 +1050,14 @@ def main():
                 clear_anim = None
 
         # Render
+        overlay = clear_anim is not None or level_popup_t > 0 or game_over
         WIN.fill(BLACK)
-        grid = create_grid(locked)
-        draw_grid(WIN, grid)
-        if current is not None:
-            ghost = get_ghost_piece(current, locked)
-            draw_ghost(WIN, ghost)
-            draw_current_piece(WIN, current)
+        ghost = get_ghost_piece(current, board, col_top) if current is not None else None
+        piece_rects = draw_playfield(WIN, board, current, ghost)
         draw_panel(WIN, score, level, lines_cleared_total, next_queue, hold_piece, high_score)
         draw_playfield_border(WIN)
         if clear_anim is not None:
-            total = 0.35
-            phase = max(0.0, min(1.0, 1.0 - clear_anim["t"] / total))
+            phase = max(0.0, min(1.0, 1.0 - clear_anim["t"] / clear_anim["t_total"]))
             draw_line_clear_flash(WIN, clear_anim["rows"], phase)
         if level_popup_t > 0:
             draw_level_popup(WIN, level, level_popup_t)
@@ -832,20 +1066,36 @@ def main():
             if score > high_score:
                 high_score = score
                 save_high_score(high_score)
-            s = pygame.Surface((WIN_WIDTH, WIN_HEIGHT), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 180))
-            WIN.blit(s, (0, 0))
-            txt = FONT_HUGE.render("GAME OVER", True, WHITE)
-            scr = FONT_BIG.render(f"Score: {score}", True, WHITE)
-            best = FONT_BIG.render(f"High Score: {high_score}", True, WHITE)
-            sub = FONT_BIG.render("Press Enter to play again, Esc to quit", True, WHITE)
+            WIN.blit(_DIM_180, (0, 0))
+            txt = render_text(FONT_HUGE, "GAME OVER", WHITE)
+            scr = render_text(FONT_BIG, f"Score: {score}", WHITE)
+            best = render_text(FONT_BIG, f"High Score: {high_score}", WHITE)
+            sub = render_text(FONT_BIG, "Press Enter to play again, Esc to quit", WHITE)
             cx = PLAY_TOPLEFT[0] + PLAY_WIDTH // 2
             cy = PLAY_TOPLEFT[1] + PLAY_HEIGHT // 2
             WIN.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2 - 60))
             WIN.blit(scr, (cx - scr.get_width() // 2, cy - scr.get_height() // 2 - 10))
             WIN.blit(best, (cx - best.get_width() // 2, cy - best.get_height() // 2 + 30))
             WIN.blit(sub, (cx - sub.get_width() // 2, cy - sub.get_height() // 2 + 70))
-        pygame.display.flip()
+
+        # Present only what can differ from the last frame: the old and new piece
+        # areas, plus the playfield or panel when their contents changed.
+        # Overlays cover the whole window, so those frames flip everything.
+        board_bytes = board.tobytes()
+        hud = (score, level, lines_cleared_total, high_score,
+               hold_piece.kind if hold_piece else None, tuple(next_queue[:2]))
+        if overlay or prev_piece_rects is None:
+            pygame.display.flip()
+        else:
+            dirty = piece_rects + prev_piece_rects
+            if board_bytes != prev_board:
+                dirty.append(PLAY_RECT)
+            if hud != prev_hud:
+                dirty.append(PANEL_RECT)
+            pygame.display.update(dirty)
+        prev_piece_rects = None if overlay else piece_rects
+        prev_board = board_bytes
+        prev_hud = hud
 
     pygame.quit()
     sys.exit()